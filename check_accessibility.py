@@ -4,225 +4,463 @@ Accessibility Checker - CLI tool to audit websites for accessibility issues
 Built with AI-assisted development using goose.
 """
 
+import atexit
+import codecs
+import hashlib
+import io
+import json
+import os
+import re
 import sys
+import tempfile
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
+from lxml import etree
 from urllib.parse import urlparse
 
-def print_header():
+def print_header(file=None):
     """Print formatted header"""
-    print("\n╔══════════════════════════════════════════════════════╗")
-    print("║     🦆 ACCESSIBILITY CHECKER v1.0                    ║")
-    print("║     Powered by AI-Assisted Development               ║")
-    print("╠══════════════════════════════════════════════════════╣\n")
+    print("\n╔══════════════════════════════════════════════════════╗", file=file)
+    print("║     🦆 ACCESSIBILITY CHECKER v1.0                    ║", file=file)
+    print("║     Powered by AI-Assisted Development               ║", file=file)
+    print("╠══════════════════════════════════════════════════════╣\n", file=file)
 
-def print_footer():
+def print_footer(file=None):
     """Print formatted footer"""
-    print("\n╚══════════════════════════════════════════════════════╝\n")
+    print("\n╚══════════════════════════════════════════════════════╝\n", file=file)
 
-def check_images(soup):
-    """Check for images without alt text"""
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'a11y-checker')
+# Bump whenever the checks change so stale results are re-audited
+CACHE_VERSION = 3
+
+# Batch audits run on up to this many threads, sharing one pooled session
+MAX_WORKERS = 32
+_SESSION = requests.Session()
+# Share connections only: cookies set by one page must not change what later audits see
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0 (Accessibility Checker)'
+_SESSION.mount('http://', HTTPAdapter(pool_maxsize=MAX_WORKERS))
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=MAX_WORKERS))
+atexit.register(_SESSION.close)
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+# Refuse bodies past this size so a huge page can't exhaust memory or CPU
+MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_HELD_TAGS = ('a', 'button', 'form')
+_CHECKED_TAGS = ('html', 'img', 'meta') + _HELD_TAGS + _HEADING_TAGS
+_FORM_INPUT_TAGS = ('input', 'textarea', 'select')
+_LABEL_FOR_XPATH = etree.XPath('.//label[@for]')
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=', re.IGNORECASE)
+_VAGUE_LINK_TEXTS = frozenset(('click here', 'read more', 'here', 'link', 'more'))
+_VAGUE_LINK_MAX_LEN = max(map(len, _VAGUE_LINK_TEXTS))
+# Recommendation shown for each issue flag set by run_all_checks, in report order
+_RECOMMENDATIONS = (
+    ('missing_alt', "1. Add descriptive alt text to all images"),
+    ('missing_label', "2. Ensure all interactive elements have proper labels"),
+    ('vague_link', "3. Use descriptive link text instead of 'click here'"),
+)
+
+def check_image(img):
+    """Check an image for missing alt text"""
+    alt = img.get('alt')
+    if not alt or not alt.strip():
+        src = img.get('src', 'unknown')
+        return f"Image missing alt text: {src[:50]}"
+    return None
+
+def check_button(button):
+    """Check a button for a missing label"""
+    if not button.get('aria-label') and not ''.join(button.itertext()).strip():
+        return "Button without accessible label"
+    return None
+
+def check_link(link):
+    """Check a link for vague text"""
+    text = ''.join(link.itertext()).strip()
+    # Casefolding never shortens text, so only short links need the lookup
+    if len(text) <= _VAGUE_LINK_MAX_LEN:
+        text = text.casefold()
+        if text in _VAGUE_LINK_TEXTS:
+            return f"Link with vague text: '{text}'"
+    return None
+
+def check_form(form):
+    """Check form accessibility"""
+    passed = []
     issues = []
-    images = soup.find_all('img')
     
-    for img in images:
-        if not img.get('alt') or img.get('alt').strip() == '':
-            src = img.get('src', 'unknown')
-            issues.append(f"Image missing alt text: {src[:50]}")
+    # Index labels once so each input is an O(1) lookup
+    labels_by_for = {label.get('for'): label for label in _LABEL_FOR_XPATH(form) if label.get('for')}
     
-    return issues
-
-def check_buttons(soup):
-    """Check for buttons without labels"""
-    issues = []
-    buttons = soup.find_all('button')
+    inputs = form.iter(*_FORM_INPUT_TAGS)
+    for inp in inputs:
+        label = labels_by_for.get(inp.get('id'))
+        if label is None:
+            # An input nested inside its label is implicitly associated with it
+            label = next(inp.iterancestors('label'), None)
+        if label is None and inp.get('type') != 'hidden':
+            issues.append(f"Form input without associated label")
+        else:
+            passed.append("Form label properly associated")
     
-    for button in buttons:
-        if not button.get('aria-label') and not button.text.strip():
-            issues.append(f"Button without accessible label")
+    return issues, passed
+
+class PageTooLarge(Exception):
+    """Raised when a page body exceeds MAX_RESPONSE_BYTES"""
     
-    return issues
+    def __init__(self, limit=MAX_RESPONSE_BYTES):
+        super().__init__(f"Page is larger than {limit // (1024 * 1024)} MB")
 
-def check_links(soup):
-    """Check for links with vague text"""
-    issues = []
-    vague_texts = ['click here', 'read more', 'here', 'link', 'more']
-    links = soup.find_all('a')
+def declared_encoding(response):
+    """Return the charset the server declared, or None if it declared no usable one"""
+    # requests falls back to ISO-8859-1 for text/* without a charset, so only trust an explicit one
+    if 'charset' not in response.headers.get('Content-Type', ''):
+        return None
+    try:
+        codecs.lookup(response.encoding)
+    except LookupError:
+        # A bogus or misspelt charset shouldn't fail the audit
+        return None
+    return response.encoding
+
+def sniff_encoding(head):
+    """Pick an encoding from the start of a body whose headers don't declare one"""
+    # libxml2 honours a BOM or <meta charset> itself, but otherwise decodes as Latin-1
+    if head.startswith(_BOMS) or _META_CHARSET_RE.search(head):
+        return None
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        # Not UTF-8 either, so leave legacy pages to the Latin-1 default
+        return None
+    return 'utf-8'
+
+def declared_length(response):
+    """Return the Content-Length of a response, or None if it is missing or malformed"""
+    try:
+        return int(response.headers.get('Content-Length', ''))
+    except ValueError:
+        return None
+
+class ResponseReader:
+    """File-like view of a streamed response body, capped at MAX_RESPONSE_BYTES"""
     
-    for link in links:
-        text = link.text.strip().lower()
-        if text in vague_texts:
-            issues.append(f"Link with vague text: '{text}'")
+    def __init__(self, response, limit=MAX_RESPONSE_BYTES):
+        # iter_content undoes gzip/deflate and raises requests exceptions on network errors
+        self.chunks = response.iter_content(CHUNK_SIZE)
+        self.limit = limit
+        self.received = 0
+        self.pending = None
     
-    return issues
+    def peek(self):
+        """Return the first chunk of the body without consuming it"""
+        if self.pending is None:
+            self.pending = self.read()
+        return self.pending
+    
+    def read(self, size=-1):
+        """Return the next chunk of the body, or b'' once it is exhausted"""
+        if self.pending is not None:
+            chunk, self.pending = self.pending, None
+            return chunk
+        chunk = next(self.chunks, b'')
+        self.received += len(chunk)
+        if self.received > self.limit:
+            raise PageTooLarge(self.limit)
+        return chunk
 
-def check_headings(soup):
-    """Check heading hierarchy"""
-    passed = []
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+def run_all_checks(source, encoding=None):
+    """Run every check in a single streaming pass over the document"""
+    image_issues = []
+    button_issues = []
+    link_issues = []
+    form_issues = []
+    form_passed = []
+    heading_count = 0
+    has_lang = False
+    has_viewport = False
+    # Open elements whose subtree is still needed (link/button text, form labels)
+    held = 0
+    parsed_any = False
     
-    if headings:
-        passed.append(f"Found {len(headings)} semantic headings")
+    events = etree.iterparse(source, events=('start', 'end'), tag=_CHECKED_TAGS,
+                             html=True, encoding=encoding)
+    try:
+        for event, el in events:
+            parsed_any = True
+            tag = el.tag
+            if event == 'start':
+                if tag == 'html':
+                    has_lang = el.get('lang') is not None
+                elif tag in _HELD_TAGS:
+                    held += 1
+                continue
+            
+            if tag == 'img':
+                issue = check_image(el)
+                if issue:
+                    image_issues.append(issue)
+            elif tag == 'button':
+                issue = check_button(el)
+                if issue:
+                    button_issues.append(issue)
+            elif tag == 'a':
+                issue = check_link(el)
+                if issue:
+                    link_issues.append(issue)
+            elif tag == 'form':
+                issues, passed = check_form(el)
+                form_issues.extend(issues)
+                form_passed.extend(passed)
+            elif tag == 'meta':
+                if el.get('name') == 'viewport':
+                    has_viewport = True
+            elif tag in _HEADING_TAGS:
+                heading_count += 1
+            
+            if tag in _HELD_TAGS:
+                held -= 1
+            if not held:
+                # Free checked nodes so memory tracks open elements, not page size.
+                # Unchecked wrappers (div, li, td...) get no events of their own, so
+                # drop the finished earlier siblings of every ancestor as well.
+                el.clear(keep_tail=True)
+                for node in (el, *el.iterancestors()):
+                    # The root's siblings are top-level comments/PIs with no parent to delete from
+                    parent = node.getparent()
+                    while parent is not None and node.getprevious() is not None:
+                        del parent[0]
+    except etree.XMLSyntaxError as e:
+        # An empty body fails before producing any element. Anything else, such as
+        # bytes that don't match the declared encoding, means the page wasn't checked.
+        if parsed_any or e.code == etree.ErrorTypes.ERR_INVALID_ENCODING:
+            raise
     
-    return passed
-
-def check_forms(soup):
-    """Check form accessibility"""
-    passed = []
-    issues = []
+    # Note which kinds of issue turned up so recommendations needn't rescan the lists
+    flags = {
+        'missing_alt': bool(image_issues),
+        'missing_label': bool(button_issues or form_issues),
+        'vague_link': bool(link_issues),
+    }
     
-    forms = soup.find_all('form')
-    for form in forms:
-        inputs = form.find_all(['input', 'textarea', 'select'])
-        for inp in inputs:
-            label = form.find('label', {'for': inp.get('id')})
-            if not label and inp.get('type') != 'hidden':
-                issues.append(f"Form input without associated label")
-            else:
-                passed.append("Form label properly associated")
+    # Keep the report grouped by check rather than by document order
+    critical_issues = image_issues + button_issues + form_issues
+    warnings = link_issues
+    passed_checks = []
     
-    return issues, passed
+    if heading_count:
+        passed_checks.append(f"Found {heading_count} semantic headings")
+    passed_checks.extend(form_passed)
+    
+    # Basic checks
+    if has_lang:
+        passed_checks.append("Page language attribute set")
+    else:
+        warnings.append("Missing page language attribute")
+    
+    if has_viewport:
+        passed_checks.append("Responsive viewport meta tag present")
+    
+    return critical_issues, warnings, passed_checks, flags
 
 def calculate_score(critical, warnings, passed):
     """Calculate overall accessibility score"""
     total_checks = critical + warnings + passed
-    if total_checks == 0:
-        return 0
-    
     # Weight: passed = 1 point, warning = 0.5 points deducted, critical = 1 point deducted
-    score = (passed - critical - (warnings * 0.5)) / total_checks * 10
-    return max(0, min(10, score))
+    return max(0.0, min(10.0, (passed - critical - warnings * 0.5) * 10.0 / total_checks)) if total_checks else 0.0
+
+def cache_path(url):
+    """Return the results cache file for a URL"""
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+def load_cached_results(url):
+    """Load the cached audit of a URL, or None if there is no usable entry"""
+    try:
+        with open(cache_path(url), encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get('version') != CACHE_VERSION:
+        return None
+    return entry
 
-def check_accessibility(url):
-    """Main function to check accessibility"""
-    print_header()
-    print(f"Analyzing: {url}")
+def save_cached_results(url, response, results):
+    """Cache the audit of a URL if the server gave us a validator to revalidate it with"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    
+    entry = {
+        'version': CACHE_VERSION,
+        'etag': etag,
+        'last_modified': last_modified,
+        'results': results,
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write then rename so concurrent audits of the same URL never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    except OSError:
+        # The cache is only an optimisation, never fail an audit over it
+        return
+    
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, cache_path(url))
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def audit(url, out, progress):
+    """Audit a single URL, printing the report to out; returns False on failure"""
+    print_header(out)
+    print(f"Analyzing: {url}", file=out)
     
     try:
         # Fetch the page
-        print("⠿ Fetching page... ", end='', flush=True)
-        headers = {'User-Agent': 'Mozilla/5.0 (Accessibility Checker)'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        print("✓")
-        
-        # Parse HTML
-        print("⠿ Parsing HTML... ", end='', flush=True)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        print("✓")
-        
-        # Run checks
-        print("⠿ Running accessibility checks... ", end='', flush=True)
+        print("⠿ Fetching page... ", end='', file=progress, flush=True)
+        headers = {}
+        cached = load_cached_results(url)
+        if cached:
+            # Revalidate so an unchanged page skips both the body and the parse
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
         
-        critical_issues = []
-        warnings = []
-        passed_checks = []
-        
-        # Check images
-        image_issues = check_images(soup)
-        critical_issues.extend(image_issues)
-        
-        # Check buttons
-        button_issues = check_buttons(soup)
-        critical_issues.extend(button_issues)
-        
-        # Check links
-        link_issues = check_links(soup)
-        warnings.extend(link_issues)
-        
-        # Check headings
-        heading_passed = check_headings(soup)
-        passed_checks.extend(heading_passed)
-        
-        # Check forms
-        form_issues, form_passed = check_forms(soup)
-        critical_issues.extend(form_issues)
-        passed_checks.extend(form_passed)
-        
-        # Basic checks
-        if soup.find('html', lang=True):
-            passed_checks.append("Page language attribute set")
-        else:
-            warnings.append("Missing page language attribute")
-        
-        if soup.find('meta', attrs={'name': 'viewport'}):
-            passed_checks.append("Responsive viewport meta tag present")
-        
-        print("✓\n")
+        with _SESSION.get(url, headers=headers, timeout=10, stream=True) as response:
+            if cached and response.status_code == 304:
+                print("✓ (unchanged, using cached results)", file=progress, flush=True)
+                print(file=out)
+                critical_issues, warnings, passed_checks, flags = cached['results']
+            else:
+                response.raise_for_status()
+                print("✓", file=progress, flush=True)
+                
+                # Don't download and parse PDFs, images, JSON and the like
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if content_type and content_type not in HTML_CONTENT_TYPES:
+                    print(f"\n❌ Error: Not an HTML page ({content_type}), skipping.", file=out)
+                    print_footer(out)
+                    return False
+                
+                # Parse HTML and run checks as the body streams off the socket
+                print("⠿ Running accessibility checks... ", end='', file=progress, flush=True)
+                # A malformed Content-Length is ignored; ResponseReader still enforces the cap
+                length = declared_length(response)
+                if length is not None and length > MAX_RESPONSE_BYTES:
+                    raise PageTooLarge()
+                reader = ResponseReader(response)
+                encoding = declared_encoding(response) or sniff_encoding(reader.peek())
+                critical_issues, warnings, passed_checks, flags = run_all_checks(reader, encoding)
+                print("✓", file=progress, flush=True)
+                print(file=out)
+                
+                save_cached_results(url, response, [critical_issues, warnings, passed_checks, flags])
         
         # Print results
-        print("╔══════════════════════════════════════════════════════╗")
-        print("║                    RESULTS                           ║")
-        print("╠══════════════════════════════════════════════════════╣\n")
+        print("╔══════════════════════════════════════════════════════╗", file=out)
+        print("║                    RESULTS                           ║", file=out)
+        print("╠══════════════════════════════════════════════════════╣\n", file=out)
         
         # Critical issues
-        print(f"🔴 CRITICAL ISSUES ({len(critical_issues)})")
+        print(f"🔴 CRITICAL ISSUES ({len(critical_issues)})", file=out)
         if critical_issues:
             for issue in critical_issues[:5]:  # Show first 5
-                print(f"  • {issue}")
+                print(f"  • {issue}", file=out)
             if len(critical_issues) > 5:
-                print(f"  ... and {len(critical_issues) - 5} more")
+                print(f"  ... and {len(critical_issues) - 5} more", file=out)
         else:
-            print("  None found!")
-        print()
+            print("  None found!", file=out)
+        print(file=out)
         
         # Warnings
-        print(f"🟡 WARNINGS ({len(warnings)})")
+        print(f"🟡 WARNINGS ({len(warnings)})", file=out)
         if warnings:
             for warning in warnings[:5]:  # Show first 5
-                print(f"  • {warning}")
+                print(f"  • {warning}", file=out)
             if len(warnings) > 5:
-                print(f"  ... and {len(warnings) - 5} more")
+                print(f"  ... and {len(warnings) - 5} more", file=out)
         else:
-            print("  None found!")
-        print()
+            print("  None found!", file=out)
+        print(file=out)
         
         # Passed checks
-        print(f"✅ PASSED CHECKS ({len(passed_checks)})")
+        print(f"✅ PASSED CHECKS ({len(passed_checks)})", file=out)
         if passed_checks:
             for check in passed_checks[:5]:  # Show first 5
-                print(f"  • {check}")
+                print(f"  • {check}", file=out)
             if len(passed_checks) > 5:
-                print(f"  ... and {len(passed_checks) - 5} more")
-        print()
+                print(f"  ... and {len(passed_checks) - 5} more", file=out)
+        print(file=out)
         
         # Calculate score
         score = calculate_score(len(critical_issues), len(warnings), len(passed_checks))
         
-        print("╔══════════════════════════════════════════════════════╗")
-        print(f"║  OVERALL SCORE: {score:.1f}/10                               ║")
-        print("╠══════════════════════════════════════════════════════╣\n")
+        print("╔══════════════════════════════════════════════════════╗", file=out)
+        print(f"║  OVERALL SCORE: {score:.1f}/10                               ║", file=out)
+        print("╠══════════════════════════════════════════════════════╣\n", file=out)
         
         # Recommendations
-        print("TOP RECOMMENDATIONS:")
-        recommendations = []
-        if any('alt text' in issue for issue in critical_issues):
-            recommendations.append("1. Add descriptive alt text to all images")
-        if any('label' in issue.lower() for issue in critical_issues):
-            recommendations.append("2. Ensure all interactive elements have proper labels")
-        if any('vague text' in issue for issue in warnings):
-            recommendations.append("3. Use descriptive link text instead of 'click here'")
+        print("TOP RECOMMENDATIONS:", file=out)
+        recommendations = [rec for flag, rec in _RECOMMENDATIONS if flags[flag]]
         
         if not recommendations:
             recommendations = ["1. Great job! Continue monitoring accessibility"]
         
         for rec in recommendations[:3]:
-            print(f"  {rec}")
+            print(f"  {rec}", file=out)
         
-        print_footer()
+        print_footer(out)
+        return True
         
     except requests.exceptions.Timeout:
-        print("\n❌ Error: Request timed out. The website took too long to respond.")
-        print_footer()
-        sys.exit(1)
+        print("\n❌ Error: Request timed out. The website took too long to respond.", file=out)
+        print_footer(out)
+        return False
     except requests.exceptions.RequestException as e:
-        print(f"\n❌ Error fetching page: {e}")
-        print_footer()
-        sys.exit(1)
+        print(f"\n❌ Error fetching page: {e}", file=out)
+        print_footer(out)
+        return False
+    except etree.XMLSyntaxError as e:
+        print(f"\n❌ Error parsing page: {e}", file=out)
+        print_footer(out)
+        return False
+    except PageTooLarge as e:
+        print(f"\n❌ Error: {e}, skipping.", file=out)
+        print_footer(out)
+        return False
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        print_footer()
-        sys.exit(1)
+        print(f"\n❌ Unexpected error: {e}", file=out)
+        print_footer(out)
+        return False
+
+def check_accessibility(url, live_progress=True):
+    """Main function to check accessibility, returns (ok, report); ok is False on failure"""
+    # Buffer the report so concurrent audits don't interleave
+    out = io.StringIO()
+    if live_progress:
+        ok = audit(url, out, sys.stderr)
+    else:
+        # Step-by-step progress from concurrent audits would interleave on stderr,
+        # so batch runs drop it and print one status line per URL instead
+        ok = audit(url, out, io.StringIO())
+        sys.stderr.write(f"{'✓' if ok else '❌'} {url}\n")
+        sys.stderr.flush()
+    return ok, out.getvalue()
 
 def main():
     """Main entry point"""
@@ -231,7 +469,7 @@ def main():
         print("║     🦆 ACCESSIBILITY CHECKER v1.0                    ║")
         print("╠══════════════════════════════════════════════════════╣")
         print("║                                                      ║")
-        print("║  Usage: python check_accessibility.py <url>          ║")
+        print("║  Usage: python check_accessibility.py <url> [...]    ║")
         print("║                                                      ║")
         print("║  Example:                                            ║")
         print("║  python check_accessibility.py https://example.com   ║")
@@ -239,13 +477,26 @@ def main():
         print("╚══════════════════════════════════════════════════════╝\n")
         sys.exit(1)
     
-    url = sys.argv[1]
+    urls = []
+    for url in sys.argv[1:]:
+        # Add https:// if not present
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        urls.append(url)
     
-    # Add https:// if not present
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    # Network reads and lxml parsing release the GIL, so threads overlap audits
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as executor:
+        audit_url = partial(check_accessibility, live_progress=len(urls) == 1)
+        all_ok = True
+        # map yields in argument order, so reports come out in the order given
+        for ok, report in executor.map(audit_url, urls):
+            sys.stdout.write(report)
+            sys.stdout.flush()
+            all_ok = all_ok and ok
     
-    check_accessibility(url)
+    # Exit non-zero if any of the audits failed
+    if not all_ok:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,248 @@
+import sys
+import threading
+from http.client import HTTPMessage
+from io import BytesIO, StringIO
+
+import pytest
+from requests.cookies import MockRequest, MockResponse, RequestsCookieJar
+
+import check_accessibility
+from check_accessibility import (
+    PageTooLarge, ResponseReader, declared_encoding, declared_length, run_all_checks, sniff_encoding,
+)
+
+
+class FakeResponse:
+    def __init__(self, chunks=(), headers=None, status_code=200):
+        self.chunks = chunks
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.encoding = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return iter(self.chunks)
+
+
+def serve(monkeypatch, *responses):
+    """Make _SESSION.get return responses in turn, recording the headers of each request"""
+    responses = list(responses)
+    sent_headers = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr(check_accessibility._SESSION, 'get', fake_get)
+    return sent_headers
+
+
+def test_top_level_comment_before_html():
+    page = b'<!DOCTYPE html>\n<!-- saved from url=x --><html lang="en"><body><img src="a.png"></body></html>'
+    critical_issues, warnings, passed_checks, flags = run_all_checks(BytesIO(page))
+    assert critical_issues == ["Image missing alt text: a.png"]
+    assert "Page language attribute set" in passed_checks
+
+
+def test_processing_instruction_before_html():
+    page = b'<?xml version="1.0"?><html><body><a href="#">more</a></body></html>'
+    critical_issues, warnings, passed_checks, flags = run_all_checks(BytesIO(page))
+    assert "Link with vague text: 'more'" in warnings
+
+
+def test_reader_stops_past_limit():
+    reader = ResponseReader(FakeResponse([b'x' * 10, b'x' * 10]), limit=15)
+    assert reader.read() == b'x' * 10
+    with pytest.raises(PageTooLarge):
+        reader.read()
+
+
+def test_malformed_content_length_is_ignored():
+    assert declared_length(FakeResponse(headers={'Content-Length': '26, 26'})) is None
+    assert declared_length(FakeResponse(headers={'Content-Length': '26'})) == 26
+    assert declared_length(FakeResponse()) is None
+
+
+def test_input_wrapped_in_label_is_associated():
+    page = b'<html><body><form><label>Name <input type="text"></label><input type="text"></form></body></html>'
+    critical_issues, warnings, passed_checks, flags = run_all_checks(BytesIO(page))
+    assert critical_issues == ["Form input without associated label"]
+    assert passed_checks == ["Form label properly associated"]
+
+
+def test_unknown_declared_charset_falls_back_to_sniffing():
+    response = FakeResponse(headers={'Content-Type': 'text/html; charset=x-user-defined'})
+    response.encoding = 'x-user-defined'
+    assert declared_encoding(response) is None
+    response.encoding = 'utf-8'
+    assert declared_encoding(response) == 'utf-8'
+    assert declared_encoding(FakeResponse(headers={'Content-Type': 'text/html'})) is None
+
+
+def test_failed_cache_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(check_accessibility.os, 'replace', fail_replace)
+    response = FakeResponse(headers={'ETag': '"v1"'})
+    check_accessibility.save_cached_results('https://example.com', response, [[], [], [], {}])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_checked_nodes_are_freed(monkeypatch):
+    tree_sizes = []
+    check_image = check_accessibility.check_image
+
+    def record_tree_size(img):
+        tree_sizes.append(sum(1 for _ in img.getroottree().iter()))
+        return check_image(img)
+
+    monkeypatch.setattr(check_accessibility, 'check_image', record_tree_size)
+    # One block per read keeps the parser's lookahead small enough to measure what is kept
+    blocks = [b'<div><img src="a.png"><p>text</p></div>'] * 500
+    reader = ResponseReader(FakeResponse([b'<html><body>'] + blocks + [b'</body></html>']))
+    critical_issues, warnings, passed_checks, flags = run_all_checks(reader)
+    assert len(critical_issues) == 500
+    # Finished wrapper blocks are dropped too, so the tree doesn't grow with the page
+    assert max(tree_sizes) < 20
+
+
+def test_empty_body_is_an_empty_page():
+    critical_issues, warnings, passed_checks, flags = run_all_checks(BytesIO(b''))
+    assert (critical_issues, warnings, passed_checks) == ([], ["Missing page language attribute"], [])
+
+
+def test_wrongly_declared_encoding_is_an_error():
+    with pytest.raises(check_accessibility.etree.XMLSyntaxError):
+        run_all_checks(BytesIO(b'<html><body><img src="a.png"></body></html>'), 'utf-32')
+
+
+def test_undeclared_utf8_page_is_decoded_as_utf8():
+    page = '<html><body><img src="é.png"><a href="#">read more\xa0</a></body></html>'.encode('utf-8')
+    reader = ResponseReader(FakeResponse([page]))
+    critical_issues, warnings, passed_checks, flags = run_all_checks(reader, sniff_encoding(reader.peek()))
+    assert critical_issues == ["Image missing alt text: é.png"]
+    assert "Link with vague text: 'read more'" in warnings
+
+
+def test_sniffing_defers_to_in_document_declarations():
+    assert sniff_encoding(b'<html><head><meta charset="windows-1252"></head>') is None
+    assert sniff_encoding(b'\xef\xbb\xbf<html>') is None
+    # Undeclared bytes that aren't UTF-8 keep the parser's Latin-1 default
+    assert sniff_encoding('<p>café</p>'.encode('latin-1')) is None
+
+
+def set_cookie_response(url):
+    headers = HTTPMessage()
+    headers['Set-Cookie'] = 'consent=yes; Path=/'
+    request = check_accessibility.requests.Request('GET', url).prepare()
+    return MockResponse(headers), MockRequest(request)
+
+
+def test_session_does_not_keep_cookies():
+    response, request = set_cookie_response('https://example.com/')
+    # A default jar would keep this cookie
+    jar = RequestsCookieJar()
+    jar.extract_cookies(response, request)
+    assert len(jar) == 1
+
+    check_accessibility._SESSION.cookies.extract_cookies(response, request)
+    assert len(check_accessibility._SESSION.cookies) == 0
+
+
+def test_unchanged_page_reuses_cached_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+    page = b'<html><body><img src="a.png"></body></html>'
+    sent_headers = serve(
+        monkeypatch,
+        FakeResponse([page], {'Content-Type': 'text/html', 'ETag': '"v1"'}),
+        FakeResponse(status_code=304),
+    )
+
+    first = StringIO()
+    assert check_accessibility.audit('https://example.com', first, StringIO())
+    second, progress = StringIO(), StringIO()
+    assert check_accessibility.audit('https://example.com', second, progress)
+
+    assert 'If-None-Match' not in sent_headers[0]
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    assert "unchanged, using cached results" in progress.getvalue()
+    assert "Image missing alt text: a.png" in second.getvalue()
+    assert second.getvalue() == first.getvalue()
+
+
+def test_cache_entries_from_other_versions_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+    response = FakeResponse(headers={'ETag': '"v1"'})
+    check_accessibility.save_cached_results('https://example.com', response, [[], [], [], {}])
+    assert check_accessibility.load_cached_results('https://example.com')['etag'] == '"v1"'
+
+    monkeypatch.setattr(check_accessibility, 'CACHE_VERSION', check_accessibility.CACHE_VERSION + 1)
+    assert check_accessibility.load_cached_results('https://example.com') is None
+
+
+class UnreadableBody(FakeResponse):
+    def iter_content(self, chunk_size):
+        raise AssertionError("body should not be read")
+
+
+def test_non_html_response_is_skipped_unread(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+    serve(monkeypatch, UnreadableBody(headers={'Content-Type': 'application/json; charset=utf-8'}))
+    out = StringIO()
+    assert not check_accessibility.audit('https://example.com/data', out, StringIO())
+    assert "Not an HTML page (application/json)" in out.getvalue()
+
+
+def test_response_without_content_type_is_parsed(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+    serve(monkeypatch, FakeResponse([b'<html><body><img src="a.png"></body></html>']))
+    out = StringIO()
+    assert check_accessibility.audit('https://example.com', out, StringIO())
+    assert "Image missing alt text: a.png" in out.getvalue()
+
+
+def test_batch_reports_follow_argument_order(monkeypatch, capsys):
+    second_done = threading.Event()
+
+    def fake_check(url, live_progress=True):
+        if url.endswith('/first'):
+            # Finish last, after the second audit
+            assert second_done.wait(5)
+            return False, "first report\n"
+        second_done.set()
+        return True, "second report\n"
+
+    monkeypatch.setattr(check_accessibility, 'check_accessibility', fake_check)
+    monkeypatch.setattr(sys, 'argv', ['check_accessibility.py', 'https://a.test/first', 'https://a.test/second'])
+    with pytest.raises(SystemExit) as exit_info:
+        check_accessibility.main()
+
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out == "first report\nsecond report\n"
+
+
+def test_batch_reports_match_single_url_reports(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(check_accessibility, 'CACHE_DIR', str(tmp_path))
+    page = b'<html><body><img src="a.png"></body></html>'
+    serve(monkeypatch, FakeResponse([page]), FakeResponse([page]))
+
+    ok, single_report = check_accessibility.check_accessibility('https://example.com')
+    single_progress = capsys.readouterr().err
+    ok, batch_report = check_accessibility.check_accessibility('https://example.com', live_progress=False)
+    batch_progress = capsys.readouterr().err
+
+    assert batch_report == single_report
+    assert "⠿" not in batch_report
+    assert "⠿ Fetching page... ✓" in single_progress
+    assert batch_progress == "✓ https://example.com\n"